@@ -3,32 +3,105 @@ import zipfile
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import threading
-import zlib
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import gzip
 import bz2
 import lzma
 import struct
-from collections import Counter
+import functools
 import heapq
 import io
 import binascii
 
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import deflate  # libdeflate bindings, ~2x faster than stock zlib
+except ImportError:
+    deflate = None
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _entropy_u8(arr):
+        """Single-pass histogram + entropy reduction over a uint8 array."""
+        counts = np.zeros(256, np.int64)
+        for i in range(arr.size):
+            counts[arr[i]] += 1
+        n = arr.size
+        entropy = 0.0
+        for k in range(256):
+            if counts[k]:
+                p = counts[k] / n
+                entropy -= p * math.log2(p)
+        return entropy
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def _entropy_4k(arr):
+        """_entropy_u8 specialized to the full 4096-byte sample.
+
+        The fixed trip count lets the JIT unroll the histogram loop and
+        drop bounds checks, shaving per-call overhead off the most
+        common case.
+        """
+        counts = np.zeros(256, np.int64)
+        for i in range(4096):
+            counts[arr[i]] += 1
+        entropy = 0.0
+        for k in range(256):
+            if counts[k]:
+                p = counts[k] / 4096.0
+                entropy -= p * math.log2(p)
+        return entropy
+else:
+    _entropy_u8 = None
+    _entropy_4k = None
+
 class AdvancedCompression:
     def __init__(self):
         self.chunk_size = 1024 * 1024  # 1MB chunks for large files
-        
+
+        # Pay the JIT compilation cost up front rather than on the first file
+        if _entropy_u8 is not None:
+            _entropy_u8(np.zeros(16, dtype=np.uint8))
+            _entropy_4k(np.zeros(4096, dtype=np.uint8))
+
     def analyze_data(self, data):
         """Analyze data to determine best compression method."""
-        # Calculate entropy to determine data complexity
-        entropy = self._calculate_entropy(data[:4096])  # Sample first 4KB
-        
+        # A memoryview slice is a pointer+length, not a 4KB copy
+        return self.pick_method(memoryview(data)[:4096], len(data))
+
+    def pick_method(self, head, size):
+        """Choose a compression method from a head sample and the file size.
+
+        Only the first 4KB of the file is needed, so callers can decide
+        how to handle a file before reading the whole thing. Results are
+        memoized on (head, size): batches of similar files hit the cache
+        and skip the entropy and signature work entirely.
+        """
+        return self._cached_pick(bytes(head), size)
+
+    @functools.lru_cache(maxsize=4096)
+    def _cached_pick(self, head, size):
         # Check if data is already compressed
-        if self._is_compressed(data[:4096]):
+        if self._is_compressed(head):
             return 'store'  # Don't compress already compressed files
-            
+
         # Choose compression method based on entropy and size
-        if len(data) < 1024:  # Small files
+        if size < 1024:  # Small files
             return 'zlib'
-        elif entropy > 7.5:  # High entropy (complex data)
+
+        entropy = self._calculate_entropy(head)
+
+        if entropy > 7.5:  # High entropy (complex data)
             return 'lzma'
         elif entropy > 6.5:  # Medium entropy
             return 'bzip2'
@@ -36,60 +109,56 @@ class AdvancedCompression:
             return 'zlib'
     
     def _calculate_entropy(self, data):
-        """Calculate Shannon entropy of data."""
+        """Calculate Shannon entropy of data in bits per byte."""
         if not data:
-            return 0
-        
-        counts = Counter(data)
-        total = len(data)
-        entropy = 0
-        
-        for count in counts.values():
-            probability = count / total
-            entropy -= probability * (probability.bit_length())
-        
-        return entropy
+            return 0.0
+
+        arr = np.frombuffer(data, dtype=np.uint8)
+
+        if _entropy_u8 is not None:
+            if arr.size == 4096:
+                return _entropy_4k(arr)
+            return _entropy_u8(arr)
+
+        counts = np.bincount(arr, minlength=256).astype(np.float64)
+        probabilities = counts / arr.size
+        nonzero = probabilities[probabilities > 0]
+
+        return float(-(nonzero * np.log2(nonzero)).sum())
     
+    # Magic numbers of already-compressed formats, grouped by prefix
+    # length so the check is a few set lookups instead of a loop of
+    # startswith calls
+    _SIG2 = frozenset((b'\x1f\x8b',))                # GZIP
+    _SIG3 = frozenset((b'BZh', b'\xFF\xD8\xFF'))     # BZIP2, JPEG
+    _SIG4 = frozenset((b'PK\x03\x04', b'\x89PNG'))   # ZIP, PNG
+    _SIG5 = frozenset((b'\xFD7zXZ',))                # XZ
+
     def _is_compressed(self, data):
         """Check if data is already compressed."""
-        # Check for common compression signatures
-        compression_signatures = [
-            b'PK\x03\x04',  # ZIP
-            b'\x1f\x8b',    # GZIP
-            b'BZh',         # BZIP2
-            b'\xFD7zXZ',    # XZ
-            b'\x89PNG',     # PNG
-            b'\xFF\xD8\xFF', # JPEG
-        ]
-        
-        return any(data.startswith(sig) for sig in compression_signatures)
-    
-    def preprocess_text(self, data):
-        """Preprocess text data for better compression."""
-        try:
-            # Try to decode as text
-            text = data.decode('utf-8')
-            
-            # Remove redundant whitespace
-            text = ' '.join(text.split())
-            
-            # Convert to lowercase for better compression if it's all text
-            if text.isalnum():
-                text = text.lower()
-            
-            return text.encode('utf-8')
-        except UnicodeDecodeError:
-            return data  # Return original if not valid text
+        return (data[:2] in self._SIG2
+                or data[:3] in self._SIG3
+                or data[:4] in self._SIG4
+                or data[:5] in self._SIG5)
     
+    def _stream_compress(self, data, compressor):
+        """Feed data through an incremental compressor in chunk_size pieces.
+
+        Keeps the compressor's working set bounded by chunk_size instead
+        of handing it the whole buffer at once.
+        """
+        mv = memoryview(data)
+        parts = []
+        for i in range(0, len(mv), self.chunk_size):
+            parts.append(compressor.compress(mv[i:i + self.chunk_size]))
+        parts.append(compressor.flush())
+        return b''.join(parts)
+
     def compress_data(self, data, method='auto'):
         """Compress data using the most effective method."""
         if method == 'auto':
             method = self.analyze_data(data)
-        
-        # Preprocess data if it's text
-        if method != 'store' and not self._is_compressed(data[:4096]):
-            data = self.preprocess_text(data)
-        
+
         compressed = None
         compression_method = ''
         
@@ -98,29 +167,44 @@ class AdvancedCompression:
                 return data, 'store'
             
             elif method == 'zlib':
-                # Try different compression levels
-                best_compressed = data
-                best_level = 6
-                
-                for level in [1, 6, 9]:
-                    try_compressed = zlib.compress(data, level)
-                    if len(try_compressed) < len(best_compressed):
-                        best_compressed = try_compressed
-                        best_level = level
-                
-                compressed = best_compressed
-                compression_method = f'zlib-{best_level}'
+                # Ratio matters most on small files, throughput on big ones
+                if len(data) > (64 << 20):
+                    level = 1
+                elif len(data) < (64 << 10):
+                    level = 9
+                else:
+                    level = 6
+
+                # Emit a gzip container rather than a bare zlib stream so
+                # the member can be unpacked with standard tools
+                if deflate is not None:
+                    compressed = deflate.gzip_compress(data, level)
+                else:
+                    compressed = gzip.compress(data, compresslevel=level, mtime=0)
+
+                compression_method = 'gz'
             
             elif method == 'bzip2':
-                compressed = bz2.compress(data, compresslevel=9)
-                compression_method = 'bzip2'
+                compressed = self._stream_compress(data, bz2.BZ2Compressor(9))
+                compression_method = 'bz2'
             
             elif method == 'lzma':
-                filters = [
-                    {'id': lzma.FILTER_LZMA2, 'preset': 9}
-                ]
-                compressed = lzma.compress(data, format=lzma.FORMAT_RAW, filters=filters)
-                compression_method = 'lzma'
+                # Preset 9 only pays off on small inputs; mid presets are
+                # 10-20x faster at a few percent ratio loss on big ones.
+                if len(data) < 256 * 1024:
+                    preset = 9 | lzma.PRESET_EXTREME
+                else:
+                    preset = 6
+
+                compressed = self._stream_compress(
+                    data,
+                    lzma.LZMACompressor(
+                        format=lzma.FORMAT_XZ,
+                        check=lzma.CHECK_CRC32,
+                        preset=preset
+                    )
+                )
+                compression_method = 'xz'
             
             # Return original data if compression didn't help
             if compressed and len(compressed) < len(data):
@@ -131,6 +215,66 @@ class AdvancedCompression:
             print(f"Compression error: {str(e)}")
             return data, 'store'
 
+# Per-process compression engine for the worker pool, created lazily so
+# each worker pays the setup (and JIT warmup) cost once.
+_worker_engine = None
+
+
+def _compress_one(file_path, method):
+    """Read and compress a single file; runs in a pool worker process."""
+    global _worker_engine
+    if _worker_engine is None:
+        _worker_engine = AdvancedCompression()
+
+    with open(file_path, 'rb') as f:
+        data = f.read()
+
+    compressed, used_method = _worker_engine.compress_data(data, method=method)
+
+    arc_name = os.path.basename(file_path)
+    if used_method != 'store':
+        arc_name = f"{arc_name}.{used_method}"
+
+    return arc_name, compressed
+
+
+# Files above this size are streamed straight into the zip instead of
+# being read fully into memory for analysis.
+STREAMING_THRESHOLD = 8 * 1024 * 1024
+
+
+def _write_streamed(zipf, file_path, arc_name, compress_type, compresslevel,
+                    chunk_size, reader):
+    """Stream one file into the zip with double-buffered reads.
+
+    The single-thread `reader` executor fetches chunk N+1 from disk
+    while the compressor is still chewing on chunk N, so disk and CPU
+    time overlap instead of alternating. Peak memory stays at two
+    chunks.
+    """
+    zinfo = zipfile.ZipInfo.from_file(file_path, arc_name)
+    zinfo.compress_type = compress_type
+    zinfo._compresslevel = compresslevel
+
+    with open(file_path, 'rb') as f, zipf.open(zinfo, 'w') as dest:
+        future = reader.submit(f.read, chunk_size)
+        while True:
+            chunk = future.result()
+            if not chunk:
+                break
+            future = reader.submit(f.read, chunk_size)
+            dest.write(chunk)
+
+# Map of compression methods to the zipfile constants used when streaming.
+ZIP_COMPRESS_TYPES = {
+    'auto': zipfile.ZIP_DEFLATED,
+    'zlib': zipfile.ZIP_DEFLATED,
+    'bzip2': zipfile.ZIP_BZIP2,
+    'lzma': zipfile.ZIP_LZMA,
+    'store': zipfile.ZIP_STORED,
+}
+
+
 class ZipMakerGUI:
     def __init__(self, root):
         self.root = root
@@ -141,8 +285,12 @@ class ZipMakerGUI:
         # Initialize compression engine
         self.compression_engine = AdvancedCompression()
         
-        # Initialize variables
-        self.files_to_zip = []
+        # File table as parallel arrays: path, stat'd size and the codec
+        # picked from a 4KB head sample, all filled at add time so
+        # create_zip never re-stats or re-samples.
+        self.paths = []
+        self.sizes = []
+        self.picks = []
         self.compression_method = tk.StringVar(value='auto')
         self.is_processing = False
         
@@ -196,16 +344,18 @@ class ZipMakerGUI:
         # Create tree view for files
         self.tree = ttk.Treeview(
             list_frame,
-            columns=('size', 'path'),
+            columns=('size', 'method', 'path'),
             show='headings',
             selectmode='extended'
         )
-        
+
         # Configure columns
         self.tree.heading('size', text='Size')
+        self.tree.heading('method', text='Codec')
         self.tree.heading('path', text='File Path')
         self.tree.column('size', width=100)
-        self.tree.column('path', width=500)
+        self.tree.column('method', width=80)
+        self.tree.column('path', width=420)
         
         # Add scrollbar
         scrollbar = ttk.Scrollbar(list_frame, orient='vertical', command=self.tree.yview)
@@ -240,13 +390,14 @@ class ZipMakerGUI:
         )
         self.create_button.pack(fill='x')
     
+    _SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
     def format_size(self, size):
         """Format file size in human-readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        return f"{size:.1f} TB"
+        # bit_length picks the unit directly: one shift and one divide,
+        # no repeated /= 1024 with its accumulated float drift
+        i = min(max(int(size), 1).bit_length() - 1, 40) // 10
+        return f"{size / (1 << (10 * i)):.1f} {self._SIZE_UNITS[i]}"
     
     def add_files(self):
         """Open file dialog and add selected files to the list."""
@@ -256,22 +407,37 @@ class ZipMakerGUI:
         )
         
         for file in files:
-            if file not in self.files_to_zip:
-                self.files_to_zip.append(file)
-                size = os.path.getsize(file)
+            if file not in self.paths:
+                # Stat and sample once here so create_zip can work from
+                # the cached arrays instead of re-touching the file.
+                size = os.stat(file).st_size
+                with open(file, 'rb') as f:
+                    head = f.read(4096)
+                pick = self.compression_engine.pick_method(head, size)
+
+                # All columns are appended in one block so the arrays
+                # stay the same length even if a later file in the
+                # batch raises
+                self.paths.append(file)
+                self.picks.append(pick)
+                self.sizes.append(size)
+
                 self.tree.insert('', 'end', values=(
                     self.format_size(size),
+                    pick,
                     file
                 ))
-    
+
     def clear_files(self):
         """Clear all files from the list."""
-        self.files_to_zip.clear()
+        self.paths.clear()
+        self.sizes.clear()
+        self.picks.clear()
         self.tree.delete(*self.tree.get_children())
     
     def create_zip_threaded(self):
         """Start zip creation in a separate thread."""
-        if not self.files_to_zip:
+        if not self.paths:
             messagebox.showwarning("Warning", "No files selected!")
             return
         
@@ -297,39 +463,85 @@ class ZipMakerGUI:
     def create_zip(self, output_path):
         """Create a zip file containing all added files."""
         try:
-            total_files = len(self.files_to_zip)
-            original_size = 0
+            total_files = len(self.paths)
+            original_size = int(np.asarray(self.sizes, dtype=np.int64).sum())
             compressed_size = 0
             
-            with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for index, file_path in enumerate(self.files_to_zip, 1):
-                    self.update_status(f"Processing: {os.path.basename(file_path)}")
-                    
-                    with open(file_path, 'rb') as f:
-                        data = f.read()
-                    
-                    original_size += len(data)
-                    method = self.compression_method.get()
-                    
-                    if method != 'store':
-                        compressed_data, used_method = self.compression_engine.compress_data(
-                            data,
-                            method=method
-                        )
-                        
+            completed = 0
+
+            # The radio buttons are disabled while processing, so one Tk
+            # read up front covers the whole run.
+            chosen_method = self.compression_method.get()
+
+            # Throttle progress/status pushes: each one is a synchronous
+            # Tk round-trip, and ~30Hz is as fast as anyone can read.
+            last_ui = 0.0
+
+            with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf, \
+                    ThreadPoolExecutor(max_workers=1) as reader:
+                pooled = []  # (file_path, resolved method) for the worker pool
+
+                for file_path, file_size, pick in zip(self.paths, self.sizes, self.picks):
+                    if chosen_method == 'auto':
+                        method = pick  # decided from the head sample at add time
+                    else:
+                        method = chosen_method
+
+                    if method == 'store' or file_size > STREAMING_THRESHOLD:
+                        # Stream through zipfile's own chunked writer so peak
+                        # memory stays O(chunk) instead of O(filesize).
                         arc_name = os.path.basename(file_path)
-                        if used_method != 'store':
-                            arc_name = f"{arc_name}.{used_method}"
-                        
-                        zipf.writestr(arc_name, compressed_data)
-                        compressed_size += len(compressed_data)
+
+                        now = time.monotonic()
+                        if now - last_ui > 0.033:
+                            last_ui = now
+                            self.update_status(f"Processing: {arc_name}")
+                            self.update_progress((completed / total_files) * 100)
+
+                        _write_streamed(
+                            zipf,
+                            file_path,
+                            arc_name,
+                            compress_type=ZIP_COMPRESS_TYPES[method],
+                            compresslevel=6 if method == 'zlib' else None,
+                            chunk_size=self.compression_engine.chunk_size,
+                            reader=reader
+                        )
+                        compressed_size += zipf.getinfo(arc_name).compress_size
+                        completed += 1
                     else:
-                        zipf.write(file_path, os.path.basename(file_path))
-                        compressed_size += os.path.getsize(file_path)
-                    
-                    progress = (index / total_files) * 100
-                    self.update_progress(progress)
-            
+                        pooled.append((file_path, method))
+
+                if pooled:
+                    # The heavy lifting happens inside the C compressors, so
+                    # worker processes scale it across cores; only the final
+                    # writes are serialized into the zip here.
+                    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+                        futures = [
+                            pool.submit(_compress_one, path, method)
+                            for path, method in pooled
+                        ]
+
+                        for future in as_completed(futures):
+                            arc_name, compressed_data = future.result()
+                            zipf.writestr(
+                                arc_name,
+                                compressed_data,
+                                compress_type=zipfile.ZIP_STORED
+                            )
+                            compressed_size += len(compressed_data)
+                            completed += 1
+
+                            now = time.monotonic()
+                            if now - last_ui > 0.033:
+                                last_ui = now
+                                self.update_status(f"Compressed: {arc_name}")
+                                self.update_progress((completed / total_files) * 100)
+
+            # Make sure the bar lands on 100% even if the last updates
+            # were throttled away
+            self.update_progress(100)
+
             # Calculate and show compression ratio
             ratio = (1 - (compressed_size / original_size)) * 100
             message = (f"Zip file created successfully!\n"